@@ -10,14 +10,24 @@ Dependencies: pip install openpyxl
 
 import re
 import os
+import mmap
+import queue
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, compress, islice
+from operator import attrgetter
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from datetime import datetime
+from datetime import datetime, timezone
+from dataclasses import dataclass
+from zipfile import ZipFile, ZIP_DEFLATED
 
 try:
     from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment
     from openpyxl.utils import get_column_letter
+    from openpyxl.writer.excel import ExcelWriter
     HAS_OPENPYXL = True
 except ImportError:
     HAS_OPENPYXL = False
@@ -50,29 +60,308 @@ FONT_FAMILY = "Segoe UI"
 # ─────────────────────────────────────────────────────────────────────────────
 # MAP FILE PARSER
 # ─────────────────────────────────────────────────────────────────────────────
+# Patterns are compiled once here instead of per line inside parse_map_file.
+_RE_GROUP = re.compile(r"^(\S.*?):\s*(\[\d+\])?\s*$")
+_RE_MOD = re.compile(r"\s+(\S+\.o)\s+(.*)")
+_RE_NUMS = re.compile(r"[\d']+")
+# ENTRY LIST patterns and field values.
+# Entry lines have: Name  Address  Size  Type  Scope  Object
+# Long names are wrapped onto their own line, leaving the name column empty.
+_RE_ENTRY = re.compile(
+    r"[ \t]*(?:(?!0x)(\S+)[ \t]+)?"
+    r"(0x[\da-fA-F][\da-fA-F']*)[ \t]+(0x[\da-fA-F][\da-fA-F']*)[ \t]+(Code|Data)[ \t]+(Gb|Lc|Wk)[ \t]+(.*)"
+)
+# An address or size field as _RE_ENTRY accepts it, checked before int(..., 16)
+_RE_HEX = re.compile(r"0x[\da-fA-F][\da-fA-F']*")
+_ENTRY_TYPES = frozenset(("Code", "Data"))
+_ENTRY_SCOPES = frozenset(("Gb", "Lc", "Wk"))
+# Leading "\n" rather than "^": sre skips ahead on a literal prefix but
+# tests a MULTILINE anchor at every byte of the section.
+_RE_FOOTNOTE = re.compile(rb"\n[ \t]*\[\d+\][ \t]*=")
+_RE_DIR_HASH = re.compile(r"_\d{10,}\.dir")
+# Final summary: the matched alternative's group name is the summary key
+_RE_SUMMARY = re.compile(
+    r"^[ \t]*([\d',]+)[ \t]+bytes of "
+    r"(?:(?P<readonly_code>readonly\s+code)|(?P<readonly_data>readonly\s+data)|(?P<readwrite_data>readwrite data))"
+    r" memory",
+    re.MULTILINE,
+)
+
+# Thousands separators IAR may emit inside a number
+_DIGIT_STRIP = str.maketrans("", "", "', ")
+
+
+@dataclass
+class ModuleEntry:
+    """One object file row of the MODULE SUMMARY section."""
+    __slots__ = ("name", "group", "ro_code", "ro_data", "rw_data", "total")
+    name: str
+    group: str
+    ro_code: int
+    ro_data: int
+    rw_data: int
+    total: int
+
+
+@dataclass
+class Entry:
+    """One symbol row of the ENTRY LIST section."""
+    __slots__ = ("name", "address", "size", "type", "scope", "object")
+    name: str
+    address: str
+    size: int
+    type: str
+    scope: str
+    object: str
+
+
 def parse_iar_number(s: str) -> int:
     """Parse IAR-formatted numbers like 10'751 or 1'168."""
-    if not s or s.strip() == "":
-        return 0
-    return int(s.strip().replace("'", "").replace(",", ""))
+    s = s.strip()
+    return int(s.translate(_DIGIT_STRIP)) if s else 0
+
+
+def _iter_lines(mm):
+    """Yield decoded lines of a mapped file lazily, from the start."""
+    pos = 0
+    size = len(mm)
+    while pos < size:
+        end = mm.find(b"\n", pos)
+        if end < 0:
+            end = size
+        yield mm[pos:end].decode("utf-8", "replace").rstrip("\r")
+        pos = end + 1
+
+
+def _iter_block_lines(mm, pos: int, end: int, block_size: int = 1 << 20, progress=None):
+    """
+    Yield the lines of mm[pos:end], decoding one block of whole lines at a time.
+
+    progress, if given, is called after each block with the fraction of the
+    whole file read so far.
+    """
+    while pos < end:
+        stop = min(pos + block_size, end)
+        if stop < end:
+            # Cut the block after its last complete line
+            nl = mm.rfind(b"\n", pos, stop)
+            if nl < 0:
+                nl = mm.find(b"\n", stop, end)
+            stop = end if nl < 0 else nl + 1
+        yield from mm[pos:stop].decode("utf-8", "replace").splitlines()
+        pos = stop
+        if progress is not None:
+            progress(stop / len(mm))
+
+
+def _parse_module_summary(lines, result: dict):
+    """Parse the MODULE SUMMARY section into result["modules"] / ["grand_total"]."""
+    # Find header line to determine column positions
+    header_line = next((l for l in islice(lines, 10) if "Module" in l and "ro code" in l), None)
+    if header_line is None:
+        return
+
+    # Find column positions from header
+    ro_code_col = header_line.find("ro code")
+    ro_data_col = header_line.find("ro data")
+    rw_data_col = header_line.find("rw data")
+
+    current_module_group = ""
+    next(lines, None)  # skip separator
+    for line in lines:
+        # Skip empty lines before paying for any strip
+        if not line or line.isspace():
+            continue
+
+        stripped = line.strip()
+
+        # End of module summary section
+        if stripped.startswith("***"):
+            break
 
+        # Skip separator lines
+        if stripped.startswith("---"):
+            continue
+
+        # Grand total line
+        if "Grand Total:" in line:
+            parts = _RE_NUMS.findall(line)
+            nums = [parse_iar_number(p) for p in parts]
+            if len(nums) >= 3:
+                result["grand_total"]["ro_code"] = nums[0]
+                result["grand_total"]["ro_data"] = nums[1]
+                result["grand_total"]["rw_data"] = nums[2]
+            elif len(nums) == 2:
+                result["grand_total"]["ro_code"] = nums[0]
+                result["grand_total"]["ro_data"] = nums[1]
+            elif len(nums) == 1:
+                result["grand_total"]["ro_code"] = nums[0]
+            continue
+
+        # Total line for a group — skip
+        if stripped.startswith("Total:"):
+            continue
+
+        # Gaps / Linker created lines — skip
+        if stripped.startswith("Gaps") or stripped.startswith("Linker created"):
+            continue
+
+        # Module group header: a line ending with : or : [N]
+        # e.g., "C:\path\to\dir: [1]" or "dl7M_tlf.a: [5]" or "command line/config:"
+        group_match = _RE_GROUP.match(line) if ":" in line else None
+        # ...unless its first token (up to the first space) names an object file
+        if group_match and ".o" not in (stripped[:stripped.find(" ")] if " " in stripped else stripped):
+            current_module_group = group_match.group(1).strip()
+            # Simplify long paths to just the directory name
+            if "\\" in current_module_group or "/" in current_module_group:
+                parts_path = current_module_group.replace("\\", "/").split("/")
+                current_module_group = parts_path[-1] if parts_path[-1] else current_module_group
+            # Remove hash suffixes like _6603591812247902717.dir
+            if ".dir" in current_module_group:
+                current_module_group = _RE_DIR_HASH.sub("", current_module_group)
+            continue
+
+        # Module data line: starts with whitespace, has a .o file,
+        # then numbers aligned to the header columns
+        # e.g., "    stm32f4xx_hal.o             144        8       12"
+        # e.g., "    main.o                      380"
+        mod_match = _RE_MOD.match(line) if ".o" in line else None
+        if mod_match:
+            name = mod_match.group(1).replace(".o", "")
+
+            # Use column positions to determine which columns have data
+            # The numbers are right-aligned to their column headers
+            ro_code = 0
+            ro_data = 0
+            rw_data = 0
+
+            if ro_code_col >= 0 and ro_data_col >= 0 and rw_data_col >= 0:
+                # Extract text at each column region
+                # ro_code region: from ro_code_col to ro_data_col
+                # ro_data region: from ro_data_col to rw_data_col
+                # rw_data region: from rw_data_col to end
+                # Columns starting past the end of a short line stay 0
+                # without slicing out an empty string to parse
+                line_len = len(line)
+                if line_len > ro_code_col:
+                    ro_code = parse_iar_number(line[ro_code_col:ro_data_col])
+                if line_len > ro_data_col:
+                    ro_data = parse_iar_number(line[ro_data_col:rw_data_col])
+                if line_len > rw_data_col:
+                    rw_data = parse_iar_number(line[rw_data_col:])
+            else:
+                # Fallback: just use the numbers in order
+                nums = [parse_iar_number(n) for n in _RE_NUMS.findall(mod_match.group(2))]
+                ro_code = nums[0] if len(nums) > 0 else 0
+                ro_data = nums[1] if len(nums) > 1 else 0
+                rw_data = nums[2] if len(nums) > 2 else 0
+
+            result["modules"].append(ModuleEntry(
+                name, current_module_group, ro_code, ro_data, rw_data,
+                ro_code + ro_data + rw_data,
+            ))
+
+
+def _parse_entry_list(mm, pos: int, result: dict, progress=None):
+    """Parse the ENTRY LIST section starting at byte offset pos into result["entries"]."""
+    # Find header line, then skip it and the separator below it
+    for _ in range(10):
+        end = mm.find(b"\n", pos)
+        if end < 0:
+            return
+        line = mm[pos:end]
+        pos = end + 1
+        if b"Entry" in line and b"Address" in line and b"Size" in line:
+            break
+    else:
+        return
+    end = mm.find(b"\n", pos)
+    pos = len(mm) if end < 0 else end + 1
+
+    # The list ends at the footnotes section (lines like "[1] = ...")
+    footnote = _RE_FOOTNOTE.search(mm, pos - 1)
+    endpos = footnote.start() if footnote else len(mm)
+
+    # Entry lines are split on whitespace and type-checked field by field;
+    # the regex only runs on lines that fail that check but contain "0x".
+    append = result["entries"].append
+    is_hex = _RE_HEX.fullmatch
+    # Type, scope and object strings repeat across entries: keep one copy of each
+    share = {}.setdefault
+    prev = None  # previous line, unless it was an entry of its own
+    for line in _iter_block_lines(mm, pos, endpos, progress=progress):
+        # A blank line cannot be an entry, nor the name of a wrapped one
+        if not line or line.isspace():
+            prev = None
+            continue
+        parts = line.split(None, 5)
+        if (len(parts) == 6 and parts[0][:2] != "0x" and parts[3] in _ENTRY_TYPES
+                and parts[4] in _ENTRY_SCOPES and is_hex(parts[1]) and is_hex(parts[2])):
+            name, address, size_hex, entry_type, scope, obj = parts
+        else:
+            # Wrapped entry: the name is alone on the previous line
+            parts = line.split(None, 4)
+            if (len(parts) == 5 and parts[2] in _ENTRY_TYPES and parts[3] in _ENTRY_SCOPES
+                    and is_hex(parts[0]) and is_hex(parts[1])):
+                name = None
+                address, size_hex, entry_type, scope, obj = parts
+            else:
+                m = _RE_ENTRY.match(line) if "0x" in line else None
+                if m is None:
+                    prev = line
+                    continue
+                name, address, size_hex, entry_type, scope, obj = m.groups()
+
+        if name is None:
+            name = prev.strip() if prev is not None else ""
+            if not name or name.startswith(("0x", "-")):
+                prev = None
+                continue
+        prev = None
+
+        # Addresses and sizes may carry IAR ' digit separators. str.replace
+        # beats translate() here and returns the string itself if none.
+        size_bytes = int(size_hex.replace("'", ""), 16)
+        if size_bytes > 0:
+            obj = obj.strip()
+            append(Entry(name, address.replace("'", ""), size_bytes,
+                         share(entry_type, entry_type), share(scope, scope), share(obj, obj)))
+
+
+def _parse_final_summary(mm, result: dict):
+    """Parse the memory totals printed in the last lines of the file."""
+    # Back up to the start of the last 20 lines
+    pos = len(mm)
+    if mm[pos - 1:pos] == b"\n":
+        pos -= 1
+    for _ in range(20):
+        pos = mm.rfind(b"\n", 0, pos)
+        if pos < 0:
+            break
+
+    tail = mm[pos + 1:].decode("utf-8", "replace")
+    for m in _RE_SUMMARY.finditer(tail):
+        result["summary"][m.lastgroup] = parse_iar_number(m.group(1))
 
-def parse_map_file(filepath: str) -> dict:
+
+def parse_map_file(filepath: str, progress=None) -> dict:
     """
     Parse an IAR EWARM .map file and return structured data.
 
+    The file is memory-mapped and each section is decoded a block of lines
+    at a time, so large map files are never held in memory as a list of lines.
+
+    progress, if given, is called with the fraction (0.0-1.0) of the file
+    parsed so far, from whichever thread runs the parse.
+
     Returns dict with keys:
         - project_name: str
         - toolchain_info: str
-        - modules: list of dicts {name, ro_code, ro_data, rw_data}
-        - entries: list of dicts {name, address, size, type, object}
+        - modules: list of ModuleEntry, largest total first
+        - entries: list of Entry, largest size first
         - grand_total: dict {ro_code, ro_data, rw_data}
         - summary: dict {readonly_code, readonly_data, readwrite_data}
     """
-    with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-        content = f.read()
-    lines = content.splitlines()
-
     result = {
         "project_name": os.path.splitext(os.path.basename(filepath))[0],
         "toolchain_info": "",
@@ -82,261 +371,83 @@ def parse_map_file(filepath: str) -> dict:
         "summary": {"readonly_code": 0, "readonly_data": 0, "readwrite_data": 0},
     }
 
-    # ── Extract toolchain info ──────────────────────────────────────────
-    for line in lines[:10]:
-        if "IAR ELF Linker" in line:
-            result["toolchain_info"] = line.strip().lstrip("#").strip()
-            break
-
-    # ── Locate sections ─────────────────────────────────────────────────
-    module_summary_start = None
-    entry_list_start = None
-
-    for i, line in enumerate(lines):
-        if "MODULE SUMMARY" in line and "***" in line:
-            module_summary_start = i
-        elif "ENTRY LIST" in line and "***" in line:
-            entry_list_start = i
-
-    # ── Parse MODULE SUMMARY ────────────────────────────────────────────
-    if module_summary_start is not None:
-        # Find header line to determine column positions
-        header_idx = None
-        for i in range(module_summary_start, min(module_summary_start + 10, len(lines))):
-            if "Module" in lines[i] and "ro code" in lines[i]:
-                header_idx = i
-                break
-
-        if header_idx is not None:
-            header_line = lines[header_idx]
-            # Find column positions from header
-            ro_code_col = header_line.find("ro code")
-            ro_data_col = header_line.find("ro data")
-            rw_data_col = header_line.find("rw data")
-
-            current_module_group = ""
-            i = header_idx + 2  # skip header + separator
-            while i < len(lines):
-                line = lines[i].rstrip("\r\n")
-
-                # End of module summary section
-                if "***" in line and line.strip().startswith("***"):
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return result
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # ── Extract toolchain info ──────────────────────────────────
+            for line in islice(_iter_lines(mm), 10):
+                if "IAR ELF Linker" in line:
+                    result["toolchain_info"] = line.strip().lstrip("#").strip()
                     break
 
-                stripped = line.strip()
-
-                # Skip empty lines and separator lines
-                if not stripped or stripped.startswith("---"):
-                    i += 1
-                    continue
-
-                # Grand total line
-                if "Grand Total:" in line:
-                    parts = re.findall(r"[\d']+", line)
-                    nums = [parse_iar_number(p) for p in parts]
-                    if len(nums) >= 3:
-                        result["grand_total"]["ro_code"] = nums[0]
-                        result["grand_total"]["ro_data"] = nums[1]
-                        result["grand_total"]["rw_data"] = nums[2]
-                    elif len(nums) == 2:
-                        result["grand_total"]["ro_code"] = nums[0]
-                        result["grand_total"]["ro_data"] = nums[1]
-                    elif len(nums) == 1:
-                        result["grand_total"]["ro_code"] = nums[0]
-                    i += 1
-                    continue
-
-                # Total line for a group — skip
-                if stripped.startswith("Total:"):
-                    i += 1
-                    continue
-
-                # Gaps / Linker created lines — skip
-                if stripped.startswith("Gaps") or stripped.startswith("Linker created"):
-                    i += 1
-                    continue
-
-                # Module group header: a line ending with : or : [N]
-                # e.g., "C:\path\to\dir: [1]" or "dl7M_tlf.a: [5]" or "command line/config:"
-                group_match = re.match(r"^(\S.*?):\s*(\[\d+\])?\s*$", line)
-                if group_match and ".o" not in stripped.split()[0]:
-                    current_module_group = group_match.group(1).strip()
-                    # Simplify long paths to just the directory name
-                    if "\\" in current_module_group or "/" in current_module_group:
-                        parts_path = current_module_group.replace("\\", "/").split("/")
-                        current_module_group = parts_path[-1] if parts_path[-1] else current_module_group
-                    # Remove hash suffixes like _6603591812247902717.dir
-                    current_module_group = re.sub(r"_\d{10,}\.dir", "", current_module_group)
-                    i += 1
-                    continue
+            # ── Parse MODULE SUMMARY ────────────────────────────────────
+            module_summary_start = mm.find(b"*** MODULE SUMMARY")
+            if module_summary_start >= 0:
+                _parse_module_summary(
+                    _iter_block_lines(mm, module_summary_start, len(mm), progress=progress), result)
 
-                # Module data line: starts with whitespace, has a .o file,
-                # then numbers aligned to the header columns
-                # e.g., "    stm32f4xx_hal.o             144        8       12"
-                # e.g., "    main.o                      380"
-                mod_match = re.match(r"\s+(\S+\.o)\s+(.*)", line)
-                if mod_match:
-                    name = mod_match.group(1).replace(".o", "")
-                    rest = mod_match.group(2).strip()
-                    # Parse numbers from the rest of the line
-                    nums = re.findall(r"[\d']+", rest)
-                    nums = [parse_iar_number(n) for n in nums]
-
-                    # Use column positions to determine which columns have data
-                    # The numbers are right-aligned to their column headers
-                    ro_code = 0
-                    ro_data = 0
-                    rw_data = 0
-
-                    if ro_code_col >= 0 and ro_data_col >= 0 and rw_data_col >= 0:
-                        # Extract text at each column region
-                        # ro_code region: from ro_code_col to ro_data_col
-                        # ro_data region: from ro_data_col to rw_data_col
-                        # rw_data region: from rw_data_col to end
-                        padded = line.ljust(rw_data_col + 10)
-                        ro_code_text = padded[ro_code_col:ro_data_col].strip()
-                        ro_data_text = padded[ro_data_col:rw_data_col].strip()
-                        rw_data_text = padded[rw_data_col:].strip()
-
-                        if ro_code_text:
-                            ro_code = parse_iar_number(ro_code_text)
-                        if ro_data_text:
-                            ro_data = parse_iar_number(ro_data_text)
-                        if rw_data_text:
-                            rw_data = parse_iar_number(rw_data_text)
-                    elif nums:
-                        # Fallback: just use the numbers in order
-                        ro_code = nums[0] if len(nums) > 0 else 0
-                        ro_data = nums[1] if len(nums) > 1 else 0
-                        rw_data = nums[2] if len(nums) > 2 else 0
-
-                    result["modules"].append({
-                        "name": name,
-                        "group": current_module_group,
-                        "ro_code": ro_code,
-                        "ro_data": ro_data,
-                        "rw_data": rw_data,
-                        "total": ro_code + ro_data + rw_data,
-                    })
-
-                i += 1
-
-    # ── Parse ENTRY LIST ────────────────────────────────────────────────
-    if entry_list_start is not None:
-        # Find header to get column positions
-        header_idx = None
-        for i in range(entry_list_start, min(entry_list_start + 10, len(lines))):
-            if "Entry" in lines[i] and "Address" in lines[i] and "Size" in lines[i]:
-                header_idx = i
-                break
-
-        if header_idx is not None:
-            header_line = lines[header_idx]
-            addr_col = header_line.find("Address")
-            size_col = header_line.find("Size")
-            type_col = header_line.find("Type")
-            obj_col = header_line.find("Object")
-
-            i = header_idx + 2  # skip header + separator
-            while i < len(lines):
-                line = lines[i].rstrip("\r\n")
-
-                # End on footnotes section (lines like "[1] = ...")
-                stripped = line.strip()
-                if re.match(r"^\[\d+\]\s*=", stripped):
-                    break
-                # Skip empty lines
-                if not stripped:
-                    i += 1
-                    continue
+            # ── Parse ENTRY LIST ────────────────────────────────────────
+            entry_list_start = mm.find(b"*** ENTRY LIST")
+            if entry_list_start >= 0:
+                _parse_entry_list(mm, entry_list_start, result, progress)
 
-                # Try to parse as a full entry line
-                # Entry lines have: Name  Address  Size  Type  Scope  Object
-                # Some entries have no size (empty size column)
-                entry_match = re.match(
-                    r"(\S+)\s+(0x[\da-fA-F']+)\s+(0x[\da-fA-F]+)\s+(Code|Data)\s+(Gb|Lc|Wk)\s+(.*)",
-                    stripped
-                )
-                if entry_match:
-                    name = entry_match.group(1)
-                    address = entry_match.group(2)
-                    size_hex = entry_match.group(3)
-                    entry_type = entry_match.group(4)
-                    scope = entry_match.group(5)
-                    obj = entry_match.group(6).strip()
-
-                    size_bytes = int(size_hex, 16)
-                    if size_bytes > 0:
-                        result["entries"].append({
-                            "name": name,
-                            "address": address.replace("'", ""),
-                            "size": size_bytes,
-                            "type": entry_type,
-                            "scope": scope,
-                            "object": obj,
-                        })
-                    i += 1
-                    continue
+            # ── Parse final summary ─────────────────────────────────────
+            _parse_final_summary(mm, result)
 
-                # Check for a line with just a name (continuation/wrapped entry)
-                # Next line will have the address/size/type data
-                if stripped and not stripped.startswith("0x") and not stripped.startswith("-"):
-                    pending_name = stripped
-                    if i + 1 < len(lines):
-                        next_line = lines[i + 1].strip()
-                        cont_match = re.match(
-                            r"(0x[\da-fA-F']+)\s+(0x[\da-fA-F]+)\s+(Code|Data)\s+(Gb|Lc|Wk)\s+(.*)",
-                            next_line
-                        )
-                        if cont_match:
-                            address = cont_match.group(1)
-                            size_hex = cont_match.group(2)
-                            entry_type = cont_match.group(3)
-                            scope = cont_match.group(4)
-                            obj = cont_match.group(5).strip()
-
-                            size_bytes = int(size_hex, 16)
-                            if size_bytes > 0:
-                                result["entries"].append({
-                                    "name": pending_name,
-                                    "address": address.replace("'", ""),
-                                    "size": size_bytes,
-                                    "type": entry_type,
-                                    "scope": scope,
-                                    "object": obj,
-                                })
-                            i += 2  # skip both lines
-                            continue
-
-                i += 1
-
-    # ── Parse final summary ─────────────────────────────────────────────
-    for line in lines[-20:]:
-        m = re.match(r"\s*([\d',]+)\s+bytes of readonly\s+code memory", line)
-        if m:
-            result["summary"]["readonly_code"] = parse_iar_number(m.group(1))
-        m = re.match(r"\s*([\d',]+)\s+bytes of readonly\s+data memory", line)
-        if m:
-            result["summary"]["readonly_data"] = parse_iar_number(m.group(1))
-        m = re.match(r"\s*([\d',]+)\s+bytes of readwrite data memory", line)
-        if m:
-            result["summary"]["readwrite_data"] = parse_iar_number(m.group(1))
-
-    # Sort entries by size descending
-    result["entries"].sort(key=lambda e: e["size"], reverse=True)
+    # Sort modules by total and entries by size, descending
+    result["modules"].sort(key=attrgetter("total"), reverse=True)
+    result["entries"].sort(key=attrgetter("size"), reverse=True)
 
+    if progress is not None:
+        progress(1.0)
     return result
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # EXCEL EXPORT
 # ─────────────────────────────────────────────────────────────────────────────
+def _styled_cell(ws, value, font=None, alignment=None, fill=None, number_format=None):
+    """Build a write-only cell carrying its style, ready for ws.append."""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if alignment is not None:
+        cell.alignment = alignment
+    if fill is not None:
+        cell.fill = fill
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
+
+
+# zlib level for the .xlsx archive: openpyxl's default (6) spends most of
+# the save deflating sheet XML for a barely smaller file.
+XLSX_COMPRESSLEVEL = 3
+
+
+def _save_workbook(wb, filepath: str):
+    """Write wb to filepath like Workbook.save, with a faster zlib level."""
+    archive = ZipFile(filepath, "w", ZIP_DEFLATED, allowZip64=True, compresslevel=XLSX_COMPRESSLEVEL)
+    try:
+        wb.properties.modified = datetime.now(timezone.utc).replace(tzinfo=None)
+        ExcelWriter(wb, archive).save()
+    finally:
+        # save() closes it too, but not if writing fails part way
+        archive.close()
+
+
 def export_to_excel(data: dict, filepath: str, mcu_name: str = "STM32"):
-    """Export parsed map data to a styled Excel workbook."""
+    """
+    Export parsed map data to a styled Excel workbook.
+
+    The workbook is write-only: rows are streamed to the file as they are
+    appended, so column widths and merged ranges are declared up front.
+    """
     if not HAS_OPENPYXL:
         raise ImportError("openpyxl is required. Install with: pip install openpyxl")
 
-    wb = Workbook()
+    wb = Workbook(write_only=True)
 
     # ── Styles ──────────────────────────────────────────────────────────
     header_font = Font(name="Segoe UI", bold=True, size=11, color="FFFFFF")
@@ -345,33 +456,34 @@ def export_to_excel(data: dict, filepath: str, mcu_name: str = "STM32"):
     subtitle_font = Font(name="Segoe UI", bold=False, size=11, color="4A4E69")
     data_font = Font(name="Segoe UI", size=10)
     number_font = Font(name="Consolas", size=10)
-    border = Border(
-        bottom=Side(style="thin", color="C9CCD5"),
-    )
+    number_bold_font = Font(name="Consolas", size=10, bold=True)
+    address_font = Font(name="Consolas", size=10, color="6C63FF")
+    large_size_font = Font(name="Consolas", size=10, bold=True, color="E74C3C")
+    label_font = Font(name="Segoe UI", bold=True, size=11)
+    section_font = Font(name="Segoe UI", bold=True, size=12, color="6C63FF")
+    value_font = Font(name="Segoe UI", size=11)
+    flash_value_font = Font(name="Segoe UI", bold=True, size=11, color="27AE60")
+    ram_value_font = Font(name="Segoe UI", bold=True, size=11, color="F39C12")
     center_align = Alignment(horizontal="center", vertical="center")
     left_align = Alignment(horizontal="left", vertical="center")
 
-    accent_fill = PatternFill(start_color="6C63FF", end_color="6C63FF", fill_type="solid")
-    green_fill = PatternFill(start_color="2ECC71", end_color="2ECC71", fill_type="solid")
-    orange_fill = PatternFill(start_color="F39C12", end_color="F39C12", fill_type="solid")
     light_row = PatternFill(start_color="F7F8FC", end_color="F7F8FC", fill_type="solid")
+    total_fill = PatternFill(start_color="E8E8F0", end_color="E8E8F0", fill_type="solid")
 
     total_flash = data["summary"]["readonly_code"] + data["summary"]["readonly_data"]
     total_ram = data["summary"]["readwrite_data"]
 
     # ── Sheet 1: Summary ────────────────────────────────────────────────
-    ws1 = wb.active
-    ws1.title = "Summary"
+    ws1 = wb.create_sheet("Summary")
     ws1.sheet_properties.tabColor = "6C63FF"
+    ws1.column_dimensions["A"].width = 28
+    ws1.column_dimensions["B"].width = 45
+    ws1.merged_cells.add("A1:D1")
+    ws1.merged_cells.add("A2:D2")
 
-    ws1.merge_cells("A1:D1")
-    ws1["A1"] = "IAR EWARM Map File Analysis"
-    ws1["A1"].font = title_font
-    ws1["A1"].alignment = left_align
-
-    ws1.merge_cells("A2:D2")
-    ws1["A2"] = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-    ws1["A2"].font = subtitle_font
+    ws1.append([_styled_cell(ws1, "IAR EWARM Map File Analysis", title_font, left_align)])
+    ws1.append([_styled_cell(ws1, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}", subtitle_font)])
+    ws1.append([])
 
     summary_rows = [
         ("Project", data["project_name"]),
@@ -387,110 +499,171 @@ def export_to_excel(data: dict, filepath: str, mcu_name: str = "STM32"):
         ("Total Modules", str(len(data["modules"]))),
         ("Total Functions/Entries", str(len(data["entries"]))),
     ]
-    for row_idx, (label, value) in enumerate(summary_rows, start=4):
-        ws1.cell(row=row_idx, column=1, value=label).font = Font(name="Segoe UI", bold=True, size=11)
-        ws1.cell(row=row_idx, column=2, value=value).font = Font(name="Segoe UI", size=11)
-        if label in ("MEMORY FOOTPRINT",):
-            ws1.cell(row=row_idx, column=1).font = Font(name="Segoe UI", bold=True, size=12, color="6C63FF")
-        if label == "Total Flash":
-            ws1.cell(row=row_idx, column=2).font = Font(name="Segoe UI", bold=True, size=11, color="27AE60")
-        if label == "Read-write Data (RAM)":
-            ws1.cell(row=row_idx, column=2).font = Font(name="Segoe UI", bold=True, size=11, color="F39C12")
-
-    ws1.column_dimensions["A"].width = 28
-    ws1.column_dimensions["B"].width = 45
+    # Rows whose label or value stands out from the default fonts
+    label_fonts = {"MEMORY FOOTPRINT": section_font}
+    value_fonts = {"Total Flash": flash_value_font, "Read-write Data (RAM)": ram_value_font}
+    for label, value in summary_rows:
+        ws1.append([
+            _styled_cell(ws1, label, label_fonts.get(label, label_font)),
+            _styled_cell(ws1, value, value_fonts.get(label, value_font)),
+        ])
 
     # ── Sheet 2: Module Breakdown ───────────────────────────────────────
     ws2 = wb.create_sheet("Module Breakdown")
     ws2.sheet_properties.tabColor = "2ECC71"
 
+    col_widths2 = [30, 22, 16, 16, 16, 16, 12]
+    for i, w in enumerate(col_widths2, 1):
+        ws2.column_dimensions[get_column_letter(i)].width = w
+
     headers2 = ["Module", "Group", "RO Code (bytes)", "RO Data (bytes)", "RW Data (bytes)", "Total (bytes)", "% of Flash"]
-    for col, h in enumerate(headers2, 1):
-        cell = ws2.cell(row=1, column=col, value=h)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = center_align
-
-    modules_sorted = sorted(data["modules"], key=lambda m: m["total"], reverse=True)
-    for row_idx, mod in enumerate(modules_sorted, start=2):
-        flash_pct = (mod["ro_code"] + mod["ro_data"]) / total_flash * 100 if total_flash > 0 else 0
-        ws2.cell(row=row_idx, column=1, value=mod["name"]).font = data_font
-        ws2.cell(row=row_idx, column=2, value=mod["group"]).font = data_font
-        ws2.cell(row=row_idx, column=3, value=mod["ro_code"]).font = number_font
-        ws2.cell(row=row_idx, column=4, value=mod["ro_data"]).font = number_font
-        ws2.cell(row=row_idx, column=5, value=mod["rw_data"]).font = number_font
-        ws2.cell(row=row_idx, column=6, value=mod["total"]).font = Font(name="Consolas", size=10, bold=True)
-        ws2.cell(row=row_idx, column=7, value=round(flash_pct, 1)).font = number_font
-        ws2.cell(row=row_idx, column=3).alignment = center_align
-        ws2.cell(row=row_idx, column=4).alignment = center_align
-        ws2.cell(row=row_idx, column=5).alignment = center_align
-        ws2.cell(row=row_idx, column=6).alignment = center_align
-        ws2.cell(row=row_idx, column=7).alignment = center_align
-        if row_idx % 2 == 0:
-            for c in range(1, 8):
-                ws2.cell(row=row_idx, column=c).fill = light_row
-        ws2.cell(row=row_idx, column=7).number_format = '0.0"%"'
+    ws2.append([_styled_cell(ws2, h, header_font, center_align, header_fill) for h in headers2])
+
+    modules_sorted = data["modules"]  # already sorted by parse_map_file
+    # % of Flash for every row up front, outside the openpyxl-bound loop
+    pct_scale = 100 / total_flash if total_flash > 0 else 0
+    flash_pcts = [round((mod.ro_code + mod.ro_data) * pct_scale, 1) for mod in modules_sorted]
+    # Rows are serialized as soon as they are appended, so each stripe gets
+    # one set of styled cells per column and rows only swap their values in.
+    # Even rows (index 0) carry the light fill.
+    mod_stripes = [
+        [
+            _styled_cell(ws2, None, data_font, fill=fill),
+            _styled_cell(ws2, None, data_font, fill=fill),
+            _styled_cell(ws2, None, number_font, center_align, fill),
+            _styled_cell(ws2, None, number_font, center_align, fill),
+            _styled_cell(ws2, None, number_font, center_align, fill),
+            _styled_cell(ws2, None, number_bold_font, center_align, fill),
+            _styled_cell(ws2, None, number_font, center_align, fill, '0.0"%"'),
+        ]
+        for fill in (light_row, None)
+    ]
+    for row_idx, (mod, flash_pct) in enumerate(zip(modules_sorted, flash_pcts), start=2):
+        cells = mod_stripes[row_idx % 2]
+        name_cell, group_cell, code_cell, data_cell, rw_cell, total_cell, pct_cell = cells
+        name_cell.value = mod.name
+        group_cell.value = mod.group
+        code_cell.value = mod.ro_code
+        data_cell.value = mod.ro_data
+        rw_cell.value = mod.rw_data
+        total_cell.value = mod.total
+        pct_cell.value = flash_pct
+        ws2.append(cells)
 
     # Grand total row
-    total_row = len(modules_sorted) + 2
-    ws2.cell(row=total_row, column=1, value="GRAND TOTAL").font = Font(name="Segoe UI", bold=True, size=11)
-    ws2.cell(row=total_row, column=3, value=data["grand_total"]["ro_code"]).font = Font(name="Consolas", bold=True, size=10)
-    ws2.cell(row=total_row, column=4, value=data["grand_total"]["ro_data"]).font = Font(name="Consolas", bold=True, size=10)
-    ws2.cell(row=total_row, column=5, value=data["grand_total"]["rw_data"]).font = Font(name="Consolas", bold=True, size=10)
     grand_total_sum = data["grand_total"]["ro_code"] + data["grand_total"]["ro_data"] + data["grand_total"]["rw_data"]
-    ws2.cell(row=total_row, column=6, value=grand_total_sum).font = Font(name="Consolas", bold=True, size=10)
-
-    for c in range(1, 8):
-        ws2.cell(row=total_row, column=c).fill = PatternFill(start_color="E8E8F0", end_color="E8E8F0", fill_type="solid")
-
-    col_widths2 = [30, 22, 16, 16, 16, 16, 12]
-    for i, w in enumerate(col_widths2, 1):
-        ws2.column_dimensions[get_column_letter(i)].width = w
+    ws2.append([
+        _styled_cell(ws2, "GRAND TOTAL", label_font, fill=total_fill),
+        _styled_cell(ws2, None, fill=total_fill),
+        _styled_cell(ws2, data["grand_total"]["ro_code"], number_bold_font, fill=total_fill),
+        _styled_cell(ws2, data["grand_total"]["ro_data"], number_bold_font, fill=total_fill),
+        _styled_cell(ws2, data["grand_total"]["rw_data"], number_bold_font, fill=total_fill),
+        _styled_cell(ws2, grand_total_sum, number_bold_font, fill=total_fill),
+        _styled_cell(ws2, None, fill=total_fill),
+    ])
 
     # ── Sheet 3: Function Breakdown ─────────────────────────────────────
     ws3 = wb.create_sheet("Function Breakdown")
     ws3.sheet_properties.tabColor = "F39C12"
 
-    headers3 = ["Function / Entry", "Address", "Size (bytes)", "Type", "Scope", "Source Object"]
-    for col, h in enumerate(headers3, 1):
-        cell = ws3.cell(row=1, column=col, value=h)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = center_align
-
-    for row_idx, entry in enumerate(data["entries"], start=2):
-        ws3.cell(row=row_idx, column=1, value=entry["name"]).font = data_font
-        ws3.cell(row=row_idx, column=2, value=entry["address"]).font = Font(name="Consolas", size=10, color="6C63FF")
-        ws3.cell(row=row_idx, column=3, value=entry["size"]).font = number_font
-        ws3.cell(row=row_idx, column=4, value=entry["type"]).font = data_font
-        ws3.cell(row=row_idx, column=5, value=entry["scope"]).font = data_font
-        ws3.cell(row=row_idx, column=6, value=entry["object"]).font = data_font
-        ws3.cell(row=row_idx, column=2).alignment = center_align
-        ws3.cell(row=row_idx, column=3).alignment = center_align
-        ws3.cell(row=row_idx, column=4).alignment = center_align
-        ws3.cell(row=row_idx, column=5).alignment = center_align
-        if row_idx % 2 == 0:
-            for c in range(1, 7):
-                ws3.cell(row=row_idx, column=c).fill = light_row
-
-        # Highlight large functions (> 200 bytes)
-        if entry["size"] >= 200:
-            ws3.cell(row=row_idx, column=3).font = Font(name="Consolas", size=10, bold=True, color="E74C3C")
-
     col_widths3 = [35, 16, 14, 10, 10, 35]
     for i, w in enumerate(col_widths3, 1):
         ws3.column_dimensions[get_column_letter(i)].width = w
 
+    headers3 = ["Function / Entry", "Address", "Size (bytes)", "Type", "Scope", "Source Object"]
+    ws3.append([_styled_cell(ws3, h, header_font, center_align, header_fill) for h in headers3])
+
+    # Same per-stripe template cells; the size column has a second,
+    # highlighted cell for large functions (>= 200 bytes)
+    func_stripes = [
+        (
+            _styled_cell(ws3, None, data_font, fill=fill),
+            _styled_cell(ws3, None, address_font, center_align, fill),
+            _styled_cell(ws3, None, number_font, center_align, fill),
+            _styled_cell(ws3, None, large_size_font, center_align, fill),
+            _styled_cell(ws3, None, data_font, center_align, fill),
+            _styled_cell(ws3, None, data_font, center_align, fill),
+            _styled_cell(ws3, None, data_font, fill=fill),
+        )
+        for fill in (light_row, None)
+    ]
+    for row_idx, entry in enumerate(data["entries"], start=2):
+        name_cell, address_cell, size_cell, large_size_cell, type_cell, scope_cell, object_cell = \
+            func_stripes[row_idx % 2]
+        if entry.size >= 200:
+            size_cell = large_size_cell
+        name_cell.value = entry.name
+        address_cell.value = entry.address
+        size_cell.value = entry.size
+        type_cell.value = entry.type
+        scope_cell.value = entry.scope
+        object_cell.value = entry.object
+        ws3.append([name_cell, address_cell, size_cell, type_cell, scope_cell, object_cell])
+
     # Auto-filter on all data sheets
     ws2.auto_filter.ref = f"A1:G{len(modules_sorted) + 1}"
     ws3.auto_filter.ref = f"A1:F{len(data['entries']) + 1}"
 
-    wb.save(filepath)
+    _save_workbook(wb, filepath)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # GUI APPLICATION
 # ─────────────────────────────────────────────────────────────────────────────
+# Tcl lambda run by _bulk_insert: inserts a flat {text values tags ...} list of
+# rows under one parent with consecutive iids, so the whole batch costs one
+# Python -> Tcl call.
+_TCL_BULK_INSERT = (
+    "{tree parent iid rows} {foreach {text values tags} $rows "
+    "{$tree insert $parent end -id $iid -text $text -values $values -tags $tags; incr iid}}"
+)
+# Tcl lambda run by _clear_tree: the child list never leaves Tcl
+_TCL_CLEAR_TREE = "{tree} {$tree delete [$tree children {}]}"
+
+# Tree columns: (column id, heading text, anchor, width, minwidth)
+TREE_SPECS_MOD = (
+    ("#0",      "Group / Module",   "w",      200, 120),
+    ("group",   "Group",            "w",      160, 80),
+    ("ro_code", "RO Code",          "center", 100, 20),
+    ("ro_data", "RO Data",          "center", 100, 20),
+    ("rw_data", "RW Data",          "center", 100, 20),
+    ("total",   "Total",            "center", 100, 20),
+    ("pct",     "% Flash",          "center", 80,  20),
+)
+TREE_SPECS_FUNC = (
+    ("#0",      "Function / Entry", "w",      280, 150),
+    ("address", "Address",          "center", 130, 20),
+    ("size",    "Size (bytes)",     "center", 110, 20),
+    ("type",    "Type",             "center", 70,  20),
+    ("scope",   "Scope",            "center", 60,  20),
+    ("object",  "Source",           "w",      250, 20),
+)
+
+
+def _tree_columns(specs):
+    """Data column ids of a spec list (everything but the #0 tree column)."""
+    return tuple(spec[0] for spec in specs if spec[0] != "#0")
+
+
+def _apply_tree_specs(tree, specs):
+    """Set up the headings and columns of tree from a spec list."""
+    heading, column = tree.heading, tree.column
+    for cid, text, anchor, width, minwidth in specs:
+        heading(cid, text=text, anchor=anchor)
+        column(cid, width=width, minwidth=minwidth, anchor=anchor)
+
+
+# Larger inserts (an opened module group, the function list) go in slices
+# of this many rows, letting Tk handle events in between
+INSERT_CHUNK = 500
+
+# How often the UI checks on a background parse/export, in ms
+WORKER_POLL_MS = 50
+
+# Typing pause before the function filter is applied, in ms
+FILTER_DELAY_MS = 150
+
+
 class MapAnalyzerApp:
     def __init__(self, root: tk.Tk):
         self.root = root
@@ -501,6 +674,26 @@ class MapAnalyzerApp:
 
         self.data = None
         self.filepath = None
+        # (data, rows) from _prepare_rows for the loaded map
+        self._prep_cache = None
+        # Modules of each unopened group in mod_tree: iid -> (first iid, modules),
+        # and the factor turning their flash bytes into % of Flash
+        self._mod_groups = {}
+        self._pct_scale = 0
+        # Notebook tabs whose tree holds the loaded map
+        self._filled_tabs = set()
+        # Per tree, bumped whenever its rows are replaced (another map, another
+        # filter), so chunked inserts still pending for it can tell
+        self._fill_generation = {}
+        # Prebuilt function rows with their lowercased names for filtering
+        self._func_rows = []
+        self._func_keys = []
+        # The filter text func_tree shows, and its matches as (keys, rows)
+        self._func_query = None
+        self._func_match = ([], [])
+        self._filter_job = None
+        # Parsing and export run here, one job at a time, off the Tk thread
+        self._pool = ThreadPoolExecutor(max_workers=1)
 
         self._apply_styles()
         self._build_ui()
@@ -550,6 +743,13 @@ class MapAnalyzerApp:
                          borderwidth=0,
                          arrowsize=0)
 
+        # Progress bar
+        style.configure("Custom.Horizontal.TProgressbar",
+                         background=COLORS["accent"],
+                         troughcolor=COLORS["bg_panel"],
+                         borderwidth=0,
+                         thickness=4)
+
     def _build_ui(self):
         # ── Top bar ─────────────────────────────────────────────────────
         top_frame = tk.Frame(self.root, bg=COLORS["bg_panel"], pady=12, padx=20)
@@ -645,34 +845,21 @@ class MapAnalyzerApp:
 
         self.notebook = ttk.Notebook(nb_frame, style="Custom.TNotebook")
         self.notebook.pack(fill="both", expand=True)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_change)
 
         # Tab 1: Module Breakdown
         mod_frame = tk.Frame(self.notebook, bg=COLORS["bg_card"])
         self.notebook.add(mod_frame, text="  📦 Module Breakdown  ")
 
-        mod_cols = ("group", "ro_code", "ro_data", "rw_data", "total", "pct")
-        self.mod_tree = ttk.Treeview(mod_frame, columns=mod_cols,
+        self.mod_tree = ttk.Treeview(mod_frame, columns=_tree_columns(TREE_SPECS_MOD),
                                       show="tree headings", style="Custom.Treeview")
-        self.mod_tree.heading("#0", text="Module", anchor="w")
-        self.mod_tree.heading("group", text="Group", anchor="w")
-        self.mod_tree.heading("ro_code", text="RO Code", anchor="center")
-        self.mod_tree.heading("ro_data", text="RO Data", anchor="center")
-        self.mod_tree.heading("rw_data", text="RW Data", anchor="center")
-        self.mod_tree.heading("total", text="Total", anchor="center")
-        self.mod_tree.heading("pct", text="% Flash", anchor="center")
-
-        self.mod_tree.column("#0", width=200, minwidth=120)
-        self.mod_tree.column("group", width=160, minwidth=80)
-        self.mod_tree.column("ro_code", width=100, anchor="center")
-        self.mod_tree.column("ro_data", width=100, anchor="center")
-        self.mod_tree.column("rw_data", width=100, anchor="center")
-        self.mod_tree.column("total", width=100, anchor="center")
-        self.mod_tree.column("pct", width=80, anchor="center")
+        _apply_tree_specs(self.mod_tree, TREE_SPECS_MOD)
 
         mod_scroll = ttk.Scrollbar(mod_frame, orient="vertical",
                                     command=self.mod_tree.yview,
                                     style="Custom.Vertical.TScrollbar")
         self.mod_tree.configure(yscrollcommand=mod_scroll.set)
+        self.mod_tree.bind("<<TreeviewOpen>>", self._on_group_open)
         self.mod_tree.pack(side="left", fill="both", expand=True)
         mod_scroll.pack(side="right", fill="y")
 
@@ -680,22 +867,31 @@ class MapAnalyzerApp:
         func_frame = tk.Frame(self.notebook, bg=COLORS["bg_card"])
         self.notebook.add(func_frame, text="  🔧 Function Breakdown  ")
 
-        func_cols = ("address", "size", "type", "scope", "object")
-        self.func_tree = ttk.Treeview(func_frame, columns=func_cols,
+        filter_bar = tk.Frame(func_frame, bg=COLORS["bg_card"], padx=8, pady=6)
+        filter_bar.pack(side="top", fill="x")
+        tk.Label(filter_bar, text="Filter:", bg=COLORS["bg_card"],
+                 fg=COLORS["text_secondary"], font=(FONT_FAMILY, 10)).pack(side="left", padx=(0, 5))
+        self.func_filter_var = tk.StringVar()
+        self.func_filter_var.trace_add("write", self._on_func_filter_change)
+        filter_entry = tk.Entry(filter_bar, textvariable=self.func_filter_var,
+                                bg=COLORS["bg_input"], fg=COLORS["text_primary"],
+                                insertbackground=COLORS["text_primary"],
+                                font=(FONT_FAMILY, 10), relief="flat",
+                                width=30, highlightthickness=1,
+                                highlightbackground=COLORS["border"],
+                                highlightcolor=COLORS["accent"])
+        filter_entry.pack(side="left")
+        self.func_count_label = tk.Label(filter_bar, text="",
+                                         bg=COLORS["bg_card"],
+                                         fg=COLORS["text_muted"],
+                                         font=(FONT_FAMILY, 9))
+        self.func_count_label.pack(side="left", padx=(12, 0))
+
+        self.func_tree = ttk.Treeview(func_frame, columns=_tree_columns(TREE_SPECS_FUNC),
                                        show="tree headings", style="Custom.Treeview")
-        self.func_tree.heading("#0", text="Function / Entry", anchor="w")
-        self.func_tree.heading("address", text="Address", anchor="center")
-        self.func_tree.heading("size", text="Size (bytes)", anchor="center")
-        self.func_tree.heading("type", text="Type", anchor="center")
-        self.func_tree.heading("scope", text="Scope", anchor="center")
-        self.func_tree.heading("object", text="Source", anchor="w")
-
-        self.func_tree.column("#0", width=280, minwidth=150)
-        self.func_tree.column("address", width=130, anchor="center")
-        self.func_tree.column("size", width=110, anchor="center")
-        self.func_tree.column("type", width=70, anchor="center")
-        self.func_tree.column("scope", width=60, anchor="center")
-        self.func_tree.column("object", width=250)
+        _apply_tree_specs(self.func_tree, TREE_SPECS_FUNC)
+        # Large functions (>= 200 bytes) stand out, as in the Excel export
+        self.func_tree.tag_configure("big", foreground=COLORS["accent_red"])
 
         func_scroll = ttk.Scrollbar(func_frame, orient="vertical",
                                      command=self.func_tree.yview,
@@ -713,6 +909,11 @@ class MapAnalyzerApp:
                                     anchor="w", padx=20, pady=6)
         self.status_bar.pack(fill="x", side="bottom")
 
+        # Parse progress, packed above the status bar only while parsing
+        self.progress_bar = ttk.Progressbar(self.root, orient="horizontal",
+                                            mode="determinate", maximum=1.0,
+                                            style="Custom.Horizontal.TProgressbar")
+
     def _create_card(self, parent, label, value, accent_color):
         card = tk.Frame(parent, bg=COLORS["bg_card"], padx=16, pady=12,
                          highlightbackground=COLORS["border"],
@@ -731,6 +932,8 @@ class MapAnalyzerApp:
                               font=(FONT_FAMILY, 16, "bold"))
         val_label.pack(anchor="w")
         card._val_label = val_label
+        card._config = val_label.config
+        card._last_value = None  # value shown, once set through _update_cards
 
         unit_label = tk.Label(card, text="bytes",
                                bg=COLORS["bg_card"], fg=COLORS["text_muted"],
@@ -739,9 +942,15 @@ class MapAnalyzerApp:
 
         return card
 
-    def _update_card(self, key, value):
-        card = self.card_widgets[key]
-        card._val_label.config(text=f"{value:,}")
+    def _update_cards(self, values):
+        """Update several cards from a {key: value} mapping, skipping unchanged ones."""
+        cards = self.card_widgets
+        for key, value in values.items():
+            card = cards[key]
+            if value == card._last_value:
+                continue
+            card._last_value = value
+            card._config(text=f"{value:,}")
 
     def _browse_file(self):
         filepath = filedialog.askopenfilename(
@@ -753,57 +962,243 @@ class MapAnalyzerApp:
 
         self.filepath = filepath
         self.file_label.config(text=os.path.basename(filepath), fg=COLORS["text_primary"])
-        self.status_bar.config(text=f"Parsing: {filepath}")
-        self.root.update_idletasks()
+        self.status_bar.config(text=f"Parsing: {filepath}", fg=COLORS["text_muted"])
+        self.browse_btn.config(state="disabled")
+        self.export_btn.config(state="disabled")
+        self._prep_cache = None
+        self.progress_bar.config(value=0)
+        self.progress_bar.pack(fill="x", side="bottom")
+
+        # The worker reports progress through a queue; only this thread touches Tk
+        progress_q = queue.Queue()
+        future = self._pool.submit(parse_map_file, filepath, progress_q.put)
+        self.root.after(WORKER_POLL_MS, self._check_parse, future, progress_q)
+
+    def _check_parse(self, future, progress_q):
+        """Poll a background parse, showing its progress, and load the result once done."""
+        fraction = None
+        while not progress_q.empty():
+            fraction = progress_q.get_nowait()
+        if fraction is not None:
+            self.progress_bar.config(value=fraction)
+            self.status_bar.config(text=f"Parsing: {self.filepath} ({fraction:.0%})")
+
+        if not future.done():
+            self.root.after(WORKER_POLL_MS, self._check_parse, future, progress_q)
+            return
 
+        self.progress_bar.pack_forget()
+        self.browse_btn.config(state="normal")
         try:
-            self.data = parse_map_file(filepath)
+            self.data = d = future.result()
             self._populate_ui()
             self.export_btn.config(state="normal")
+            project, n_modules, n_entries = d["project_name"], len(d["modules"]), len(d["entries"])
             self.status_bar.config(
-                text=f"✅ Loaded: {self.data['project_name']} — "
-                     f"{len(self.data['modules'])} modules, "
-                     f"{len(self.data['entries'])} entries",
+                text=f"✅ Loaded: {project} — {n_modules} modules, {n_entries} entries",
                 fg=COLORS["accent_green"]
             )
         except Exception as e:
+            if self.data:
+                self.export_btn.config(state="normal")
             messagebox.showerror("Parse Error", f"Failed to parse map file:\n{e}")
             self.status_bar.config(text=f"❌ Error: {e}", fg=COLORS["accent_red"])
 
     def _populate_ui(self):
+        # Update cards
+        summary = self.data["summary"]
+        ro_code = summary["readonly_code"]
+        ro_data = summary["readonly_data"]
+        rw_data = summary["readwrite_data"]
+        self._update_cards({
+            "ro_code": ro_code,
+            "ro_data": ro_data,
+            "rw_data": rw_data,
+            "flash": ro_code + ro_data,
+            "ram": rw_data,
+        })
+
+        # Fill only the tab on screen; the other is filled when first shown,
+        # and holds none of the previous map's rows meanwhile
+        self._new_fill(self.mod_tree)
+        self._new_fill(self.func_tree)
+        self._clear_tree(self.mod_tree)
+        self._clear_tree(self.func_tree)
+        self.func_count_label.config(text="")
+        self._filled_tabs = set()
+        self._fill_tab(self.notebook.index("current"))
+
+    def _on_tab_change(self, event):
+        """Fill a tab's tree the first time it is shown for the loaded map."""
+        tab = self.notebook.index("current")
+        if self.data is not None and tab not in self._filled_tabs:
+            self._fill_tab(tab)
+
+    def _fill_tab(self, tab):
+        """Fill the tree of notebook tab index tab from the prepared rows."""
+        self._filled_tabs.add(tab)
+        group_rows, group_iid, mod_groups, pct_scale, func_rows, func_keys = self._prepare_rows()
+
+        if tab == 0:
+            # Module tree: one row per group, its modules on first open
+            self._mod_groups = dict(mod_groups)  # emptied as groups are opened
+            self._pct_scale = pct_scale
+            self._bulk_insert(self.mod_tree, group_rows, group_iid)
+            # A placeholder child gives every group its expand arrow
+            for giid in self._mod_groups:
+                self.mod_tree.insert(giid, "end", text="…")
+            self.mod_tree.yview_moveto(0)
+        else:
+            # Function tree: rows passing the filter, the first chunk at once
+            self._func_rows, self._func_keys = func_rows, func_keys
+            self._func_query = None  # refill even if the filter text is unchanged
+            self._apply_func_filter()
+
+    def _prepare_rows(self):
+        """
+        Build the rows both trees are filled from, once per loaded map.
+
+        Returns (group_rows, first group iid, {group iid: (first module iid, modules)},
+        % of Flash per byte, function rows, lowercased function names). None of
+        it depends on the MCU name or widget state, so re-rendering the same data
+        reuses it.
+        """
         d = self.data
+        if self._prep_cache is not None and self._prep_cache[0] is d:
+            return self._prep_cache[1]
 
-        # Update cards
         total_flash = d["summary"]["readonly_code"] + d["summary"]["readonly_data"]
-        total_ram = d["summary"]["readwrite_data"]
-        self._update_card("ro_code", d["summary"]["readonly_code"])
-        self._update_card("ro_data", d["summary"]["readonly_data"])
-        self._update_card("rw_data", d["summary"]["readwrite_data"])
-        self._update_card("flash", total_flash)
-        self._update_card("ram", total_ram)
-
-        # Populate module tree
-        self.mod_tree.delete(*self.mod_tree.get_children())
-        modules_sorted = sorted(d["modules"], key=lambda m: m["total"], reverse=True)
-        for mod in modules_sorted:
-            flash_pct = (mod["ro_code"] + mod["ro_data"]) / total_flash * 100 if total_flash > 0 else 0
-            self.mod_tree.insert("", "end", text=mod["name"],
-                                  values=(mod["group"],
-                                          f'{mod["ro_code"]:,}',
-                                          f'{mod["ro_data"]:,}',
-                                          f'{mod["rw_data"]:,}',
-                                          f'{mod["total"]:,}',
-                                          f'{flash_pct:.1f}%'))
-
-        # Populate function tree
-        self.func_tree.delete(*self.func_tree.get_children())
-        for entry in d["entries"]:
-            self.func_tree.insert("", "end", text=entry["name"],
-                                   values=(entry["address"],
-                                           f'{entry["size"]:,}',
-                                           entry["type"],
-                                           entry["scope"],
-                                           entry["object"]))
+
+        groups = defaultdict(list)
+        for mod in d["modules"]:
+            groups[mod.group].append(mod)
+        group_sums = [
+            (group, mods,
+             sum(m.ro_code for m in mods), sum(m.ro_data for m in mods), sum(m.rw_data for m in mods))
+            for group, mods in groups.items()
+        ]
+        group_sums.sort(key=lambda g: g[2] + g[3] + g[4], reverse=True)
+
+        # Module rows take iids 0..N-1 in group order, the groups N onwards
+        group_rows = []
+        mod_groups = {}
+        first_iid = 0
+        group_iid = len(d["modules"])
+        pct_scale = 100 / total_flash if total_flash > 0 else 0
+        for giid, (group, mods, ro_code, ro_data, rw_data) in enumerate(group_sums, group_iid):
+            flash_pct = (ro_code + ro_data) * pct_scale
+            group_rows.append((group or "(no group)", (f'{len(mods)} modules',
+                                                       f'{ro_code:,}',
+                                                       f'{ro_data:,}',
+                                                       f'{rw_data:,}',
+                                                       f'{ro_code + ro_data + rw_data:,}',
+                                                       f'{flash_pct:.1f}%'), ""))
+            mod_groups[str(giid)] = (first_iid, mods)
+            first_iid += len(mods)
+
+        # Sizes repeat heavily across entries, so each distinct one is
+        # formatted once and looked up per row.
+        size_text = {size: f'{size:,}' for size in {entry.size for entry in d["entries"]}}
+        func_rows = [(entry.name, (entry.address,
+                                   size_text[entry.size],
+                                   entry.type,
+                                   entry.scope,
+                                   entry.object),
+                      "big" if entry.size >= 200 else "")
+                     for entry in d["entries"]]
+        func_keys = [entry.name.lower() for entry in d["entries"]]
+
+        prepared = (group_rows, group_iid, mod_groups, pct_scale, func_rows, func_keys)
+        self._prep_cache = (d, prepared)
+        return prepared
+
+    def _on_func_filter_change(self, *args):
+        """Re-filter the function rows once typing pauses."""
+        if self._filter_job is not None:
+            self.root.after_cancel(self._filter_job)
+        self._filter_job = self.root.after(FILTER_DELAY_MS, self._apply_func_filter)
+
+    def _apply_func_filter(self):
+        """Refill func_tree with the rows whose name contains the filter text."""
+        self._filter_job = None
+        query = self.func_filter_var.get().strip().lower()
+        prev = self._func_query
+        if query == prev:
+            return  # only case or surrounding spaces changed: same rows
+        self._func_query = query
+        if query:
+            # Matched against the prebuilt row data, never the Tk items. Typing
+            # on narrows the previous matches, so only those are searched.
+            if prev and prev in query:
+                keys, rows = self._func_match
+            else:
+                keys, rows = self._func_keys, self._func_rows
+            hits = [query in key for key in keys]
+            keys, rows = list(compress(keys, hits)), list(compress(rows, hits))
+            self._func_match = (keys, rows)
+            self.func_count_label.config(text=f"{len(rows):,} of {len(self._func_rows):,}")
+        else:
+            rows = self._func_rows
+            self.func_count_label.config(text="")
+        # The first chunk shows at once, the rest streams in behind it
+        generation = self._new_fill(self.func_tree)
+        self._clear_tree(self.func_tree)
+        self._insert_chunks(self.func_tree, rows, 0, "", generation)
+        self.func_tree.yview_moveto(0)
+
+    def _module_rows(self, mods):
+        """Build mod_tree (text, values) rows for a list of ModuleEntry."""
+        pct_scale = self._pct_scale
+        rows = []
+        for mod in mods:
+            flash_pct = (mod.ro_code + mod.ro_data) * pct_scale
+            rows.append((mod.name, (mod.group,
+                                    f'{mod.ro_code:,}',
+                                    f'{mod.ro_data:,}',
+                                    f'{mod.rw_data:,}',
+                                    f'{mod.total:,}',
+                                    f'{flash_pct:.1f}%'), ""))
+        return rows
+
+    def _on_group_open(self, event):
+        """Swap an opened group's placeholder for its module rows, the first time only."""
+        giid = self.mod_tree.focus()
+        pending = self._mod_groups.pop(giid, None)
+        if pending is None:
+            return  # a module row, or a group that was already filled
+        first_iid, mods = pending
+        self.mod_tree.delete(*self.mod_tree.get_children(giid))
+        self._insert_chunks(self.mod_tree, self._module_rows(mods), first_iid, giid,
+                            self._fill_generation[self.mod_tree])
+
+    def _new_fill(self, tree):
+        """Start a new generation of rows for tree, stopping its pending chunked inserts."""
+        generation = self._fill_generation.get(tree, 0) + 1
+        self._fill_generation[tree] = generation
+        return generation
+
+    def _insert_chunks(self, tree, rows, first_iid, parent, generation, start=0):
+        """Insert rows[start:] under parent INSERT_CHUNK at a time, yielding to Tk in between."""
+        if generation != self._fill_generation[tree]:
+            return  # tree was refilled since; these rows are no longer wanted
+        stop = start + INSERT_CHUNK
+        self._bulk_insert(tree, rows[start:stop], first_iid + start, parent)
+        if stop < len(rows):
+            self.root.after_idle(self._insert_chunks, tree, rows, first_iid, parent, generation, stop)
+
+    def _clear_tree(self, tree):
+        """Delete every top-level row of tree (and so all rows) in one Tcl call."""
+        tree.tk.call("apply", _TCL_CLEAR_TREE, str(tree))
+
+    def _bulk_insert(self, tree, rows, first_iid=0, parent=""):
+        """Insert prebuilt (text, values, tags) rows in one Tcl call, data columns hidden meanwhile."""
+        displaycolumns = tree.cget("displaycolumns")
+        tree.configure(displaycolumns=())
+        try:
+            tree.tk.call("apply", _TCL_BULK_INSERT, str(tree), parent, first_iid,
+                         tuple(chain.from_iterable(rows)))
+        finally:
+            tree.configure(displaycolumns=displaycolumns)
 
     def _export_excel(self):
         if not self.data:
@@ -827,8 +1222,22 @@ class MapAnalyzerApp:
         if not filepath:
             return
 
+        self.browse_btn.config(state="disabled")
+        self.export_btn.config(state="disabled")
+        self.status_bar.config(text=f"Exporting: {os.path.basename(filepath)}", fg=COLORS["text_muted"])
+        future = self._pool.submit(export_to_excel, self.data, filepath, self.mcu_var.get())
+        self.root.after(WORKER_POLL_MS, self._check_export, future, filepath)
+
+    def _check_export(self, future, filepath):
+        """Poll a background export and report how it went once done."""
+        if not future.done():
+            self.root.after(WORKER_POLL_MS, self._check_export, future, filepath)
+            return
+
+        self.browse_btn.config(state="normal")
+        self.export_btn.config(state="normal")
         try:
-            export_to_excel(self.data, filepath, self.mcu_var.get())
+            future.result()
             self.status_bar.config(
                 text=f"📊 Exported to: {os.path.basename(filepath)}",
                 fg=COLORS["accent_green"]